@@ -1,14 +1,22 @@
 import streamlit as st
 import os
 from dotenv import load_dotenv
-from groq import Groq
+from groq import AsyncGroq, APIConnectionError, APITimeoutError
 import time
-from datetime import datetime
-import pandas as pd
-import plotly.express as px
+import hashlib
+import asyncio
+import threading
+from collections import Counter, deque
 
-# Load environment variables
-load_dotenv()
+@st.cache_resource(show_spinner=False)
+def init_env():
+    """Load environment variables and disable proxy settings once per process"""
+    load_dotenv()
+    os.environ.pop("HTTP_PROXY", None)
+    os.environ.pop("HTTPS_PROXY", None)
+    return True
+
+init_env()
 
 # Configure Streamlit page
 st.set_page_config(
@@ -18,95 +26,300 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Only the most recent analyses are kept in history
+MAX_HISTORY = 500
+
 # Initialize session state
 if 'debug_result' not in st.session_state:
     st.session_state.debug_result = None
 if 'analysis_history' not in st.session_state:
-    st.session_state.analysis_history = []
+    st.session_state.analysis_history = deque(maxlen=MAX_HISTORY)
+    st.session_state.lang_counter = Counter()
 if 'token_count' not in st.session_state:
     st.session_state.token_count = 0
 if 'show_advanced' not in st.session_state:
     st.session_state.show_advanced = False
+if 'confirm_clear' not in st.session_state:
+    st.session_state.confirm_clear = False
 
-def estimate_tokens(text):
-    """Rough estimation of tokens (4 characters per token)"""
-    return len(text) // 4
+# Display labels mapped to the names used in prompts and history
+ANALYSIS_TYPES = {
+    "Full Analysis 🎯": "Full",
+    "Security Analysis 🔒": "Security",
+    "Performance Analysis ⚡": "Performance",
+}
+LANGUAGES = {
+    "Python 🐍": "Python",
+    "C++ 🚀": "C++",
+    "Java ☕": "Java",
+    "JavaScript 🌐": "JavaScript",
+    "TypeScript 📘": "TypeScript",
+    "Go 🦘": "Go",
+    "Rust 🦀": "Rust",
+}
+
+# Prompt templates for each analysis section
+PROMPTS = {
+    "Overview": "Review this {language} code. Return: bugs, improvements, explanation, fixes.\n\n{code}",
+    "Security": "Audit this {language} code for security issues (input validation, auth, encryption, common vulnerabilities) and give specific fixes.\n\n{code}",
+    "Performance": "Find performance issues in this {language} code (algorithms, memory, queries, caching, resources) and give specific optimizations.\n\n{code}",
+}
+SECTION_TITLES = {
+    "Overview": "🎯 Overview",
+    "Security": "🔒 Security",
+    "Performance": "⚡ Performance",
+}
+
+# Sections requested in parallel for each analysis type
+ANALYSIS_SECTIONS = {
+    "Full": ("Overview", "Security", "Performance"),
+    "Security": ("Security",),
+    "Performance": ("Performance",),
+}
+
+SYSTEM_PROMPT = "You are an expert code reviewer. Be specific and actionable."
+
+# Groq models offered in Advanced Settings, fastest first, and their context windows
+MODELS = {
+    "Fast (8B)": "llama-3.1-8b-instant",
+    "Balanced (70B)": "llama-3.3-70b-versatile",
+}
+MODEL_CTX = {
+    "llama-3.1-8b-instant": 131072,
+    "llama-3.3-70b-versatile": 131072,
+}
+DEFAULT_MODEL = MODELS["Fast (8B)"]
+
+# Groq request limits
+MAX_CODE_TOKENS = 800
+DEFAULT_REQUEST_TIMEOUT = 20.0
+MAX_ATTEMPTS = 3
+RETRY_BACKOFF = 0.5
+
+# Finished analyses are reused for an hour, keeping at most this many
+RESPONSE_CACHE_TTL = 3600
+RESPONSE_CACHE_MAX_ENTRIES = 256
+
+# How often (seconds) the UI checks on a running analysis
+POLL_INTERVAL = 0.5
+
+@st.cache_resource(show_spinner=False)
+def get_encoder():
+    """Load the BPE tokenizer once per process"""
+    import tiktoken
+    return tiktoken.get_encoding("cl100k_base")
 
-def analyze_code(code, language, analysis_type, temperature=0.7, max_tokens=1024):
-    """Send code to Groq API for analysis"""
-    api_key = st.secrets["GROQ_API_KEY"]
+@st.cache_data(show_spinner=False)
+def estimate_tokens(text):
+    """Count tokens with the cl100k_base BPE encoding"""
+    return len(get_encoder().encode(text, disallowed_special=()))
 
+@st.cache_data(show_spinner=False)
+def load_api_key():
+    """Read the Groq API key from Streamlit secrets, raising if it's missing so the miss isn't cached"""
+    api_key = st.secrets.get("GROQ_API_KEY", "").strip()
     if not api_key:
-        return "Error: API key not found. Please check your Streamlit secrets."
+        raise KeyError("GROQ_API_KEY")
+    return api_key
 
+def get_api_key():
+    """Return the Groq API key from Streamlit secrets or .env, or an empty string if neither has it"""
     try:
-        # Disable proxy settings if any
-        os.environ.pop("HTTP_PROXY", None)
-        os.environ.pop("HTTPS_PROXY", None)
+        return load_api_key()
+    except (KeyError, FileNotFoundError):
+        # No secrets.toml, or no key in it; fall back to the .env loaded by init_env()
+        return os.getenv("GROQ_API_KEY", "").strip()
+
+@st.cache_resource(show_spinner=False)
+def get_event_loop():
+    """Background event loop that runs Groq requests off the Streamlit script thread"""
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return loop
+
+@st.cache_resource(show_spinner=False)
+def get_groq_client():
+    """Create a single Groq client whose connection pool is shared across reruns"""
+    # Only used from get_event_loop(), and retries are handled in analyze_code
+    return AsyncGroq(api_key=get_api_key(), timeout=DEFAULT_REQUEST_TIMEOUT, max_retries=0)  # No 'proxies' argument
+
+@st.cache_resource(show_spinner=False)
+def get_response_cache():
+    """Process-wide store of finished analyses, keyed by code hash and settings.
+
+    Only touched from get_event_loop(), so it never changes under a running update.
+    """
+    return {}
+
+def store_response(cache, key, text):
+    """Add a finished analysis to the response cache, dropping expired and oldest entries"""
+    now = time.time()
+    for expired in [k for k, (expires_at, _) in cache.items() if expires_at <= now]:
+        del cache[expired]
+    cache.pop(key, None)
+    cache[key] = (now + RESPONSE_CACHE_TTL, text)
+    # Dicts keep insertion order, so the first keys are the oldest
+    while len(cache) > RESPONSE_CACHE_MAX_ENTRIES:
+        del cache[next(iter(cache))]
 
-        # Initialize Groq client correctly
-        client = Groq(api_key=api_key.strip())  # No 'proxies' argument
+def hash_code(code):
+    """Short BLAKE2b digest of code (text or raw bytes) used to key cached analyses"""
+    if isinstance(code, str):
+        code = code.encode("utf-8")
+    return hashlib.blake2b(code, digest_size=16).hexdigest()
+
+async def analyze_code(code, language, section, temperature=0.7, max_tokens=1024,
+                       request_timeout=DEFAULT_REQUEST_TIMEOUT, code_hash=None, model=DEFAULT_MODEL):
+    """Send code to Groq API for one analysis section, yielding the response as it streams in.
+
+    Identical requests are answered from the response cache without calling the API.
+    Sampling is not deterministic, so re-running with the same settings and
+    temperature > 0 returns the cached answer rather than a fresh one.
+    """
+    prompt = PROMPTS[section].format(language=language, code=code)
+    prompt_tokens = estimate_tokens(SYSTEM_PROMPT) + estimate_tokens(prompt)
+    context = MODEL_CTX[model]
+    if prompt_tokens + max_tokens > context:
+        yield f"Error: Prompt ({prompt_tokens} tokens) plus response ({max_tokens} tokens) exceeds the {context} token context."
+        return
+
+    cache = get_response_cache()
+    cache_key = (code_hash or hash_code(code), language, section, model, temperature, max_tokens)
+    cached = cache.get(cache_key)
+    if cached and cached[0] > time.time():
+        yield cached[1]
+        return
+
+    try:
+        client = get_groq_client()
         
-        # Prepare the prompt based on analysis type
-        if analysis_type == "Security":
-            prompt = f"""Analyze this {language} code for security vulnerabilities and best practices.
-            Focus on:
-            1. Input validation
-            2. Authentication/Authorization
-            3. Data encryption
-            4. Secure coding practices
-            5. Common vulnerabilities
-            
-            Code:
-            {code}
-            
-            Provide a detailed security analysis with specific recommendations."""
-            
-        elif analysis_type == "Performance":
-            prompt = f"""Analyze this {language} code for performance optimization opportunities.
-            Focus on:
-            1. Algorithm efficiency
-            2. Memory usage
-            3. Database queries
-            4. Caching opportunities
-            5. Resource utilization
-            
-            Code:
-            {code}
-            
-            Provide a detailed performance analysis with specific optimization recommendations."""
-            
-        else:  # Full Analysis
-            prompt = f"""Analyze this {language} code and provide a comprehensive review.
-            Include:
-            1. Code structure and organization
-            2. Best practices and patterns
-            3. Potential bugs or issues
-            4. Performance considerations
-            5. Security considerations
-            6. Maintainability and readability
-            7. Suggestions for improvement
-            
-            Code:
-            {code}
-            
-            Provide a detailed analysis with specific recommendations."""
+        # Stream the completion from Groq so the UI can render it as it arrives,
+        # retrying with exponential backoff if the request times out or can't connect
+        for attempt in range(MAX_ATTEMPTS):
+            try:
+                stream = await client.chat.completions.create(
+                    model=model,
+                    messages=[
+                        {"role": "system", "content": SYSTEM_PROMPT},
+                        {"role": "user", "content": prompt}
+                    ],
+                    temperature=temperature,
+                    max_completion_tokens=min(max_tokens, context - prompt_tokens),
+                    stream=True,
+                    timeout=request_timeout
+                )
+                break
+            except (APITimeoutError, APIConnectionError):
+                if attempt == MAX_ATTEMPTS - 1:
+                    raise
+                await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt)
         
-        # Get completion from Groq with updated parameters
-        completion = client.chat.completions.create(
-            model="mixtral-8x7b-32768",
-            messages=[
-                {"role": "system", "content": "You are an expert code reviewer and analyzer. Provide detailed, actionable insights."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=temperature,
-            max_tokens=max_tokens
-        )
+        parts = []
+        async for chunk in stream:
+            content = chunk.choices[0].delta.content or ""
+            parts.append(content)
+            yield content
         
-        return completion.choices[0].message.content
+        # Only complete responses are cached
+        store_response(cache, cache_key, "".join(parts))
         
     except Exception as e:
-        return f"Error analyzing code: {str(e)}"
+        yield f"Error analyzing code: {str(e)}"
+
+async def run_analysis(sections, code, language, analysis_type, **options):
+    """Stream every section of an analysis concurrently and return the time it finished"""
+    async def collect(section):
+        async for chunk in analyze_code(code, language, section, **options):
+            sections[section].append(chunk)
+    
+    await asyncio.gather(*(collect(section) for section in ANALYSIS_SECTIONS[analysis_type]))
+    return time.time()
+
+def start_analysis(code, code_hash, lang, atype, model, temperature, max_tokens, request_timeout):
+    """Schedule an analysis on the background event loop and track it in session state"""
+    sections = {section: [] for section in ANALYSIS_SECTIONS[atype]}
+    coro = run_analysis(sections, code, lang, atype, temperature=temperature, max_tokens=max_tokens,
+                        request_timeout=request_timeout, code_hash=code_hash, model=model)
+    st.session_state.analysis_job = {
+        'future': asyncio.run_coroutine_threadsafe(coro, get_event_loop()),
+        'sections': sections,
+        'code': code,
+        'language': lang,
+        'type': atype,
+        'start_time': time.time()
+    }
+
+def show_results(sections):
+    """Render one expander per analysis section"""
+    st.markdown("### 📝 Analysis Results")
+    for section, text in sections.items():
+        with st.expander(SECTION_TITLES[section], expanded=True):
+            st.markdown(text or "🤖 Analyzing your code...")
+
+def finish_analysis(job):
+    """Record a completed analysis in history and make it the current result"""
+    result = {section: "".join(parts) for section, parts in job['sections'].items()}
+    try:
+        end_time = job['future'].result()
+    except Exception as e:
+        result = {section: f"Error analyzing code: {str(e)}" for section in result}
+        end_time = time.time()
+    st.session_state.token_count += sum(estimate_tokens(job['code']) + estimate_tokens(text)
+                                        for text in result.values())
+    
+    # Add to history, keeping the language counts in step with evictions
+    history = st.session_state.analysis_history
+    lang_counter = st.session_state.lang_counter
+    if len(history) == history.maxlen:
+        evicted = history[0]['language']
+        lang_counter[evicted] -= 1
+        if not lang_counter[evicted]:
+            del lang_counter[evicted]
+    lang_counter[job['language']] += 1
+    history.append({
+        'timestamp_ns': time.time_ns(),
+        'language': job['language'],
+        'type': job['type'],
+        'duration': round(end_time - job['start_time'], 2)
+    })
+    
+    st.session_state.debug_result = result
+    del st.session_state.analysis_job
+
+@st.fragment
+def analyze_panel(code, code_hash, lang, atype, model, temperature, max_tokens, request_timeout):
+    """Analyze button and results, rerun on their own so a click doesn't redraw the page"""
+    pending = 'analysis_job' in st.session_state
+
+    # Analysis button with status
+    analyze_clicked = st.button("🔍 Analyze Code", type="primary", disabled=pending)
+    if analyze_clicked and not code:
+        st.warning("⚠️ Please provide some code to analyze.")
+    elif analyze_clicked and not get_api_key():
+        st.warning("⚠️ API key not found. Please check your Streamlit secrets.")
+    elif analyze_clicked:
+        code_tokens = estimate_tokens(code)
+        if code_tokens > MAX_CODE_TOKENS:
+            st.warning(f"⚠️ Code is {code_tokens} tokens, the maximum is {MAX_CODE_TOKENS}. Please shorten it.")
+        else:
+            start_analysis(code, code_hash, lang, atype, model, temperature, max_tokens, request_timeout)
+            # Full rerun so the polling panel below picks up the new job
+            st.rerun()
+    
+    # Display results with better formatting
+    if not pending and st.session_state.debug_result:
+        show_results(st.session_state.debug_result)
+
+@st.fragment(run_every=POLL_INTERVAL)
+def pending_analysis_panel():
+    """Show the running analysis as it streams in, polling the background worker"""
+    job = st.session_state.analysis_job
+    show_results({section: "".join(parts) for section, parts in job['sections'].items()})
+    
+    if job['future'].done():
+        finish_analysis(job)
+        # Refresh the sidebar stats and stop polling
+        st.rerun()
 
 # Sidebar
 with st.sidebar:
@@ -118,13 +331,13 @@ with st.sidebar:
     with col1:
         st.metric("Analyses Done", len(st.session_state.analysis_history))
     with col2:
-        st.metric("Languages Used", len(set(h['language'] for h in st.session_state.analysis_history)))
+        st.metric("Languages Used", len(st.session_state.lang_counter))
     
     # Analysis Type Selection with Emojis
     st.markdown("### 🔍 Analysis Type")
     analysis_type = st.radio(
         "Choose what you want to analyze",
-        ["Full Analysis 🎯", "Security Analysis 🔒", "Performance Analysis ⚡"],
+        list(ANALYSIS_TYPES),
         label_visibility="collapsed"
     )
     
@@ -132,14 +345,16 @@ with st.sidebar:
     st.markdown("### 💻 Language")
     language = st.selectbox(
         "Select your code language",
-        ["Python 🐍", "C++ 🚀", "Java ☕", "JavaScript 🌐", "TypeScript 📘", "Go 🦘", "Rust 🦀"],
+        list(LANGUAGES),
         label_visibility="collapsed"
     )
     
     # Advanced Settings in a collapsible section
     with st.expander("⚙️ Advanced Settings"):
+        model = st.selectbox("Model", list(MODELS), index=0)
         temperature = st.slider("Creativity Level", 0.0, 1.0, 0.7, 0.1)
         max_tokens = st.slider("Response Length", 100, 2048, 1024, 100)
+        request_timeout = st.slider("Request Timeout (seconds)", 5, 60, int(DEFAULT_REQUEST_TIMEOUT), 5)
     
     # Quick Tips
     st.markdown("### 💡 Quick Tips")
@@ -152,23 +367,162 @@ with st.sidebar:
     
     # Fun Fact
     if st.session_state.analysis_history:
-        most_used_lang = max(set(h['language'] for h in st.session_state.analysis_history), 
-                           key=st.session_state.analysis_history.count)
+        most_used_lang = st.session_state.lang_counter.most_common(1)[0][0]
         st.markdown(f"### 🎯 Fun Fact")
         st.success(f"You analyze {most_used_lang} code the most!")
     
     # Clear History with Confirmation
     if st.button("🗑️ Clear History"):
-        if st.warning("Are you sure you want to clear all history?"):
-            st.session_state.analysis_history = []
-            st.session_state.token_count = 0
-            st.rerun()
+        st.session_state.confirm_clear = True
+    if st.session_state.confirm_clear:
+        st.warning("Are you sure you want to clear all history?")
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.button("Confirm clear"):
+                st.session_state.analysis_history.clear()
+                st.session_state.lang_counter.clear()
+                st.session_state.token_count = 0
+                # Clear on the loop thread so it can't race an analysis storing its result
+                get_event_loop().call_soon_threadsafe(get_response_cache().clear)
+                st.session_state.confirm_clear = False
+                st.rerun()
+        with col2:
+            if st.button("Cancel"):
+                st.session_state.confirm_clear = False
+                st.rerun()
     
     # Footer in Sidebar
     st.markdown("---")
     st.markdown("Made with ❤️ by Sairam")
     st.markdown("[GitHub](https://github.com/BavirisettySairam) | [LinkedIn](https://www.linkedin.com/in/bavirisetty-sairam/)")
 
+# Static content for the Documentation and About tabs
+DOCS_MD = """
+### 📚 Documentation
+
+#### Analysis Types
+1. **Full Analysis**
+   - Syntax errors and bugs
+   - Code improvements
+   - Detailed explanation
+   - Suggested fixes
+   - Performance considerations
+
+2. **Security Analysis**
+   - Security vulnerabilities
+   - Common risks
+   - Best practices
+   - Security improvements
+
+3. **Performance Analysis**
+   - Performance bottlenecks
+   - Optimization opportunities
+   - Memory usage
+   - Performance improvements
+
+#### Usage Guidelines
+- Maximum code size: 800 tokens (~3,200 characters)
+- Supported languages: Python, C++, Java, JavaScript, TypeScript, Go, Rust
+- File types: .py, .cpp, .java, .js, .ts, .go, .rs, .txt
+"""
+
+ABOUT_MD = """
+### ℹ️ About Basic Code Analyzer
+
+Basic Code Analyzer is a powerful tool that helps developers analyze their code using advanced AI technology. Built with passion and precision, this tool aims to make code analysis accessible and efficient for developers of all levels.
+
+#### 🚀 Features
+- **Multiple Analysis Types**
+    - Full code analysis with comprehensive insights
+    - Security vulnerability scanning
+    - Performance optimization suggestions
+- **Language Support**
+    - Python, C++, Java, JavaScript, TypeScript, Go, Rust
+    - More languages coming soon!
+- **Smart Features**
+    - Real-time token estimation
+    - Analysis history tracking
+    - Usage statistics and visualizations
+    - Advanced customization options
+- **User-Friendly Interface**
+    - Clean, intuitive design
+    - Interactive visualizations
+    - Detailed documentation
+    - Responsive layout
+
+#### 🛠️ Technology Stack
+- **Frontend**: Streamlit
+    - Modern, responsive UI
+    - Interactive components
+    - Real-time updates
+- **Backend**: Python
+    - Efficient code processing
+    - Robust error handling
+    - Scalable architecture
+- **AI Engine**: Groq AI
+    - State-of-the-art language model
+    - Fast response times
+    - Accurate code analysis
+
+#### 📊 Performance Metrics
+- Maximum code size: 800 tokens (~3,200 characters)
+- Average analysis time: < 5 seconds
+- Support for files up to 100KB
+- Real-time token estimation
+
+#### 🔒 Security Features
+- Secure API key management
+- No code storage
+- Privacy-focused design
+- Safe file handling
+
+#### 🎯 Use Cases
+- Code review automation
+- Learning and education
+- Debugging assistance
+- Performance optimization
+- Security auditing
+
+#### 📝 Version History
+- **v1.0.0** (Current)
+    - Initial release
+    - Basic code analysis
+    - Multiple language support
+- **v1.1.0** (Planned)
+    - Additional language support
+    - Enhanced security analysis
+    - Custom analysis templates
+
+#### 👨‍💻 About the Developer
+**Bavirisetty Sairam**
+- MCA Student at Christ University
+- Passionate about AI and Software Development
+- Focused on creating innovative solutions
+
+#### 📞 Contact Information
+- 📧 Email: message2sairam@gmail.com
+- 📱 Phone: +91 9513377365
+- 🔗 LinkedIn: [Bavirisetty Sairam](https://www.linkedin.com/in/bavirisetty-sairam/)
+- 🌐 GitHub: [BavirisettySairam](https://github.com/BavirisettySairam)
+- 📸 Instagram: mr_bavirisetty
+
+#### 🤝 Contributing
+We welcome contributions! Please feel free to:
+- Report bugs
+- Suggest features
+- Submit pull requests
+- Improve documentation
+
+#### 🙏 Acknowledgments
+- Christ University for academic support
+- Groq AI for providing the API
+- Streamlit team for the amazing framework
+- All contributors and users
+
+---
+Made with ❤️ by Bavirisetty Sairam
+"""
+
 # Main UI
 st.title("🔍 Basic Code Analyzer")
 
@@ -190,170 +544,35 @@ with tab1:
         )
     
     code = ""
+    code_hash = None
     if input_method == "Upload File 📁":
         uploaded_file = st.file_uploader("Upload your code file", type=['py', 'cpp', 'java', 'js', 'ts', 'go', 'rs', 'txt'])
         if uploaded_file is not None:
-            code = uploaded_file.getvalue().decode("utf-8")
+            # Hash the bytes we already have so the analyzer doesn't re-encode the text
+            raw = uploaded_file.getvalue()
+            code = raw.decode("utf-8", errors="replace")
+            code_hash = hash_code(raw)
     else:
         code = st.text_area("Paste your code here", height=300)
         if code:
-            char_count = len(code)
-            estimated_tokens = estimate_tokens(code)
-            st.info(f"📊 Characters: {char_count} | Tokens: {estimated_tokens} | Max: 800 tokens")
+            # Only re-measure when the pasted text actually changes
+            code_key = hash(code)
+            if st.session_state.get('_code_key') != code_key:
+                st.session_state._code_key = code_key
+                st.session_state._char_count = len(code)
+                st.session_state._token_estimate = estimate_tokens(code)
+            st.info(f"📊 Characters: {st.session_state._char_count} | Tokens: {st.session_state._token_estimate} | Max: {MAX_CODE_TOKENS} tokens")
     
-    # Analysis button with status
-    if st.button("🔍 Analyze Code", type="primary"):
-        if code:
-            with st.spinner("🤖 Analyzing your code..."):
-                start_time = time.time()
-                result = analyze_code(code, language.split()[0], analysis_type.split()[0], temperature, max_tokens)
-                end_time = time.time()
-                
-                # Add to history
-                st.session_state.analysis_history.append({
-                    'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                    'language': language.split()[0],
-                    'type': analysis_type.split()[0],
-                    'duration': round(end_time - start_time, 2)
-                })
-                
-                st.session_state.debug_result = result
-        else:
-            st.warning("⚠️ Please provide some code to analyze.")
-
-    # Display results with better formatting
-    if st.session_state.debug_result:
-        st.markdown("### 📝 Analysis Results")
-        with st.expander("View Analysis", expanded=True):
-            st.markdown(st.session_state.debug_result)
+    analyze_panel(code, code_hash, LANGUAGES[language], ANALYSIS_TYPES[analysis_type],
+                  MODELS[model], temperature, max_tokens, request_timeout)
+    if 'analysis_job' in st.session_state:
+        pending_analysis_panel()
 
 with tab2:
-    st.markdown("""
-    ### 📚 Documentation
-    
-    #### Analysis Types
-    1. **Full Analysis**
-       - Syntax errors and bugs
-       - Code improvements
-       - Detailed explanation
-       - Suggested fixes
-       - Performance considerations
-    
-    2. **Security Analysis**
-       - Security vulnerabilities
-       - Common risks
-       - Best practices
-       - Security improvements
-    
-    3. **Performance Analysis**
-       - Performance bottlenecks
-       - Optimization opportunities
-       - Memory usage
-       - Performance improvements
-    
-    #### Usage Guidelines
-    - Maximum code size: 800 tokens (~3,200 characters)
-    - Supported languages: Python, C++, Java, JavaScript, TypeScript, Go, Rust
-    - File types: .py, .cpp, .java, .js, .ts, .go, .rs, .txt
-    """)
+    st.markdown(DOCS_MD)
 
 with tab3:
-    st.markdown("""
-    ### ℹ️ About Basic Code Analyzer
-    
-    Basic Code Analyzer is a powerful tool that helps developers analyze their code using advanced AI technology. Built with passion and precision, this tool aims to make code analysis accessible and efficient for developers of all levels.
-    
-    #### 🚀 Features
-    - **Multiple Analysis Types**
-        - Full code analysis with comprehensive insights
-        - Security vulnerability scanning
-        - Performance optimization suggestions
-    - **Language Support**
-        - Python, C++, Java, JavaScript, TypeScript, Go, Rust
-        - More languages coming soon!
-    - **Smart Features**
-        - Real-time token estimation
-        - Analysis history tracking
-        - Usage statistics and visualizations
-        - Advanced customization options
-    - **User-Friendly Interface**
-        - Clean, intuitive design
-        - Interactive visualizations
-        - Detailed documentation
-        - Responsive layout
-    
-    #### 🛠️ Technology Stack
-    - **Frontend**: Streamlit
-        - Modern, responsive UI
-        - Interactive components
-        - Real-time updates
-    - **Backend**: Python
-        - Efficient code processing
-        - Robust error handling
-        - Scalable architecture
-    - **AI Engine**: Groq AI
-        - State-of-the-art language model
-        - Fast response times
-        - Accurate code analysis
-    
-    #### 📊 Performance Metrics
-    - Maximum code size: 800 tokens (~3,200 characters)
-    - Average analysis time: < 5 seconds
-    - Support for files up to 100KB
-    - Real-time token estimation
-    
-    #### 🔒 Security Features
-    - Secure API key management
-    - No code storage
-    - Privacy-focused design
-    - Safe file handling
-    
-    #### 🎯 Use Cases
-    - Code review automation
-    - Learning and education
-    - Debugging assistance
-    - Performance optimization
-    - Security auditing
-    
-    #### 📝 Version History
-    - **v1.0.0** (Current)
-        - Initial release
-        - Basic code analysis
-        - Multiple language support
-    - **v1.1.0** (Planned)
-        - Additional language support
-        - Enhanced security analysis
-        - Custom analysis templates
-    
-    #### 👨‍💻 About the Developer
-    **Bavirisetty Sairam**
-    - MCA Student at Christ University
-    - Passionate about AI and Software Development
-    - Focused on creating innovative solutions
-    
-    #### 📞 Contact Information
-    - 📧 Email: message2sairam@gmail.com
-    - 📱 Phone: +91 9513377365
-    - 🔗 LinkedIn: [Bavirisetty Sairam](https://www.linkedin.com/in/bavirisetty-sairam/)
-    - 🌐 GitHub: [BavirisettySairam](https://github.com/BavirisettySairam)
-    - 📸 Instagram: mr_bavirisetty
-    
-    #### 🤝 Contributing
-    We welcome contributions! Please feel free to:
-    - Report bugs
-    - Suggest features
-    - Submit pull requests
-    - Improve documentation
-    
-    #### 🙏 Acknowledgments
-    - Christ University for academic support
-    - Groq AI for providing the API
-    - Streamlit team for the amazing framework
-    - All contributors and users
-    
-    ---
-    Made with ❤️ by Bavirisetty Sairam
-    """)
+    st.markdown(ABOUT_MD)
 
 # Footer
 st.markdown("---")